@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 import os
+from collections import ChainMap
 from dataclasses import dataclass
 from pathlib import Path
 
-from dotenv import load_dotenv
-
 
 @dataclass(slots=True)
 class AppConfig:
@@ -31,38 +30,44 @@ def load_config(
     random_seed: int | None = None,
     env_file: str = ".env",
 ) -> AppConfig:
-    load_dotenv(env_file)
+    # Process environment wins over the .env file, as with load_dotenv, but os.environ is left untouched.
+    file_values: dict[str, str] = {}
+    if Path(env_file).is_file():
+        from dotenv import dotenv_values
+
+        file_values = {key: value for key, value in dotenv_values(env_file).items() if value is not None}
+    env = ChainMap(os.environ, file_values)
 
-    api_key = os.getenv("OPENAI_API_KEY") or os.getenv("LLM_API_KEY")
+    api_key = env.get("OPENAI_API_KEY") or env.get("LLM_API_KEY")
     if not api_key:
         raise ValueError("Missing API key. Set OPENAI_API_KEY or LLM_API_KEY in .env")
 
-    model_name = os.getenv("MODEL_NAME")
+    model_name = env.get("MODEL_NAME")
     if not model_name:
         raise ValueError("Missing MODEL_NAME in .env")
 
-    base_url = os.getenv("OPENAI_BASE_URL") or os.getenv("LLM_BASE_URL")
-    temperature = float(os.getenv("TEMPERATURE", "0"))
+    base_url = env.get("OPENAI_BASE_URL") or env.get("LLM_BASE_URL")
+    temperature = float(env.get("TEMPERATURE", "0"))
 
-    max_tokens_raw = os.getenv("MAX_TOKENS", "").strip()
+    max_tokens_raw = env.get("MAX_TOKENS", "").strip()
     max_tokens = int(max_tokens_raw) if max_tokens_raw else None
 
-    timeout = float(os.getenv("TIMEOUT", "30"))
-    retries = int(os.getenv("RETRIES", "3"))
-    resolved_workers = workers if workers is not None else int(os.getenv("WORKERS", "4"))
+    timeout = float(env.get("TIMEOUT", "30"))
+    retries = int(env.get("RETRIES", "3"))
+    resolved_workers = workers if workers is not None else int(env.get("WORKERS", "4"))
     if resolved_workers <= 0:
         raise ValueError("WORKERS must be a positive integer")
-    resolved_zh_en_limit = zh_en_limit if zh_en_limit is not None else int(os.getenv("ZH_EN_LIMIT", "-1"))
-    resolved_en_zh_limit = en_zh_limit if en_zh_limit is not None else int(os.getenv("EN_ZH_LIMIT", "-1"))
+    resolved_zh_en_limit = zh_en_limit if zh_en_limit is not None else int(env.get("ZH_EN_LIMIT", "-1"))
+    resolved_en_zh_limit = en_zh_limit if en_zh_limit is not None else int(env.get("EN_ZH_LIMIT", "-1"))
     if resolved_zh_en_limit < -1:
         raise ValueError("ZH_EN_LIMIT must be -1 or a non-negative integer")
     if resolved_en_zh_limit < -1:
         raise ValueError("EN_ZH_LIMIT must be -1 or a non-negative integer")
-    resolved_random_seed = random_seed if random_seed is not None else int(os.getenv("RANDOM_SEED", "42"))
+    resolved_random_seed = random_seed if random_seed is not None else int(env.get("RANDOM_SEED", "42"))
 
     resolved_continue = continue_on_error
     if resolved_continue is None:
-        resolved_continue = os.getenv("CONTINUE_ON_ERROR", "true").lower() in {"1", "true", "yes", "y"}
+        resolved_continue = env.get("CONTINUE_ON_ERROR", "true").lower() in {"1", "true", "yes", "y"}
 
     return AppConfig(
         api_key=api_key,
@@ -1,24 +1,45 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import random
+import re
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
-from time import perf_counter
-
-from loguru import logger
-from tqdm import tqdm
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING
 
 from .config import ensure_dirs, load_config
-from .parser import ExamItem, parse_exam
-from .translator import Translator
-from .writer import write_results_csv
+from .parser import TASK_SEED_OFFSETS, ExamItem, parse_exam, parse_exam_sampled
+from .translator import TranslationResult, Translator
+from .writer import ResultCsvWriter
+
+if TYPE_CHECKING:
+    from loguru import Logger
 
 
 VALID_TASKS = {"zh_en", "en_zh"}
-TASK_SEED_OFFSETS = {"zh_en": 11, "en_zh": 29}
+# Comma/whitespace separated tokens; anything else stays in the token so it is reported as unsupported.
+_TASK_TOKEN_RE = re.compile(r"[^,\s]+")
+# Inputs at least this large are reservoir-sampled while parsing instead of loaded whole.
+# The two samplers pick different subsets for the same seed; keep README/.env.example in sync.
+STREAM_SAMPLING_MIN_BYTES = 32 * 1024 * 1024
+PROGRESS_INTERVAL = 0.2
+
+
+# loguru, tqdm and httpx are imported on first use so --help and argument errors stay fast.
+logger: Logger | None = None
+
+
+def _get_logger() -> Logger:
+    global logger
+    if logger is None:
+        from loguru import logger as loguru_logger
+
+        logger = loguru_logger
+    return logger
 
 
 def parse_args() -> argparse.Namespace:
@@ -36,7 +57,7 @@ def parse_args() -> argparse.Namespace:
         "--workers",
         type=int,
         default=None,
-        help="Number of concurrent worker threads",
+        help="Number of concurrent in-flight requests",
     )
     parser.add_argument("--zh_en_limit", type=int, default=None, help="Random sample size for zh_en; -1 for unlimited")
     parser.add_argument("--en_zh_limit", type=int, default=None, help="Random sample size for en_zh; -1 for unlimited")
@@ -45,7 +66,9 @@ def parse_args() -> argparse.Namespace:
 
 
 def parse_selected_tasks(raw: str) -> list[str]:
-    tasks = [token.strip() for token in raw.split(",") if token.strip()]
+    tasks = _TASK_TOKEN_RE.findall(raw)
+    if not tasks:
+        raise ValueError("No tasks selected; pass --tasks with at least one of: zh_en,en_zh")
     for task in tasks:
         if task not in VALID_TASKS:
             raise ValueError(f"Unsupported task: {task}")
@@ -53,75 +76,172 @@ def parse_selected_tasks(raw: str) -> list[str]:
 
 
 def configure_logger(logs_dir: Path) -> Path:
-    logger.remove()
-    logger.add(sys.stderr, level="INFO")
+    _get_logger().remove()
+    _get_logger().add(sys.stderr, level="INFO")
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_path = logs_dir / f"run_{ts}.log"
-    logger.add(log_path, level="INFO", encoding="utf-8")
+    _get_logger().add(log_path, level="INFO", encoding="utf-8")
     return log_path
 
 
 def sample_items(task: str, items: list[ExamItem], limit: int, random_seed: int) -> list[ExamItem]:
-    if limit == -1 or limit >= len(items):
+    n = len(items)
+    if limit == -1 or limit >= n:
         return items
     if limit == 0:
         return []
 
     rng = random.Random(random_seed + TASK_SEED_OFFSETS[task])
-    sampled_indexes = sorted(rng.sample(range(len(items)), limit))
+    if limit <= n // 20:
+        sampled_indexes = sorted(_floyd_sample(rng, n, limit))
+    elif limit > n // 2:
+        sampled_indexes = sorted(_partial_shuffle_sample(rng, n, limit))
+    else:
+        sampled_indexes = sorted(rng.sample(range(n), limit))
     return [items[idx] for idx in sampled_indexes]
 
 
+def _floyd_sample(rng: random.Random, n: int, k: int) -> set[int]:
+    """Draw k unique indexes from range(n) with exactly k RNG calls (Robert Floyd)."""
+    selected: set[int] = set()
+    for j in range(n - k, n):
+        t = rng.randrange(j + 1)
+        selected.add(j if t in selected else t)
+    return selected
+
+
+def _partial_shuffle_sample(rng: random.Random, n: int, k: int) -> list[int]:
+    """Fisher-Yates shuffle of range(n) stopped after k swaps; the first k slots are the sample."""
+    indexes = list(range(n))
+    for i in range(k):
+        j = rng.randrange(i, n)
+        indexes[i], indexes[j] = indexes[j], indexes[i]
+    del indexes[k:]
+    return indexes
+
+
 def translate_task(
     task: str,
     items: list[ExamItem],
     translator: Translator,
     continue_on_error: bool,
     workers: int,
-) -> tuple[list[tuple[ExamItem, str]], int, int]:
+    on_row: Callable[[ExamItem, str], None],
+) -> tuple[int, int]:
+    """Translate items concurrently and hand each finished row to on_row in input order.
+
+    Only rows that finished ahead of an earlier, still-pending row are held in memory.
+    """
     if not items:
-        return [], 0, 0
+        return 0, 0
+
+    return asyncio.run(
+        _translate_task_async(
+            task=task,
+            items=items,
+            translator=translator,
+            continue_on_error=continue_on_error,
+            workers=workers,
+            on_row=on_row,
+        )
+    )
 
-    rows: list[tuple[ExamItem, str]] = [(item, "") for item in items]
+
+async def _translate_task_async(
+    task: str,
+    items: list[ExamItem],
+    translator: Translator,
+    continue_on_error: bool,
+    workers: int,
+    on_row: Callable[[ExamItem, str], None],
+) -> tuple[int, int]:
+    # Finished rows waiting for an earlier index before they can be emitted.
+    ready: dict[int, str] = {}
+    next_row = 0
     success_count = 0
     fail_count = 0
 
-    executor = ThreadPoolExecutor(max_workers=workers)
-    futures = {executor.submit(translator.translate, task, item.source): idx for idx, item in enumerate(items)}
-
-    try:
-        with tqdm(total=len(items), desc=f"Translating {task}", unit="line") as pbar:
-            for future in as_completed(futures):
-                idx = futures[future]
-                item = items[idx]
-                result = future.result()
-                if result.error is not None:
-                    fail_count += 1
-                    rows[idx] = (item, "")
-                    logger.opt(exception=result.error).error(
-                        "Translate failed task={} line={} source='{}'",
-                        task,
-                        item.line_no,
-                        item.source[:120],
-                    )
-                    if not continue_on_error:
-                        for pending in futures:
-                            pending.cancel()
-                        raise result.error
-                else:
-                    success_count += 1
-                    rows[idx] = (item, result.text)
-                pbar.update(1)
-    finally:
-        executor.shutdown(wait=True, cancel_futures=False)
-
-    return rows, success_count, fail_count
+    semaphore = asyncio.Semaphore(workers)
+    done_queue: asyncio.Queue[tuple[list[int], asyncio.Task[TranslationResult]]] = asyncio.Queue()
+
+    # Identical lines are translated once and the result is fanned out to every index.
+    indexes_by_source: dict[str, list[int]] = {}
+    for idx, item in enumerate(items):
+        indexes_by_source.setdefault(item.source, []).append(idx)
+
+    async def translate_one(source: str) -> TranslationResult:
+        async with semaphore:
+            return await translator.translate(task, source)
+
+    from tqdm import tqdm
+
+    async with translator:
+        pending: list[asyncio.Task[TranslationResult]] = []
+        for source, indexes in indexes_by_source.items():
+            future = asyncio.create_task(translate_one(source))
+            # The callback carries the indexes, so completions are routed without a future->index lookup.
+            future.add_done_callback(lambda f, i=indexes: done_queue.put_nowait((i, f)))
+            pending.append(future)
+        try:
+            with tqdm(
+                total=len(items),
+                desc=f"Translating {task}",
+                unit="line",
+                mininterval=PROGRESS_INTERVAL,
+                miniters=max(1, len(items) // 200),
+            ) as pbar:
+                unreported = 0
+                last_report = monotonic()
+                for _ in range(len(pending)):
+                    indexes, future = await done_queue.get()
+                    result = future.result()
+                    text = ""
+                    if result.error is not None:
+                        fail_count += len(indexes)
+                        _get_logger().opt(exception=result.error).error(
+                            "Translate failed task={} line={} source='{}'",
+                            task,
+                            ",".join(str(items[idx].line_no) for idx in indexes),
+                            items[indexes[0]].source[:120],
+                        )
+                        if not continue_on_error:
+                            raise result.error
+                    else:
+                        success_count += len(indexes)
+                        text = result.text
+                    for idx in indexes:
+                        ready[idx] = text
+                    # Emit the longest finished prefix so streamed output keeps the input order.
+                    while next_row in ready:
+                        on_row(items[next_row], ready.pop(next_row))
+                        next_row += 1
+                    # Coalesce progress updates to ~5 Hz; tqdm.update takes a lock and recomputes stats.
+                    unreported += len(indexes)
+                    now = monotonic()
+                    if now - last_report >= PROGRESS_INTERVAL:
+                        pbar.update(unreported)
+                        unreported = 0
+                        last_report = now
+                if unreported:
+                    pbar.update(unreported)
+        finally:
+            for pending_task in pending:
+                pending_task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    return success_count, fail_count
 
 
 def run() -> int:
     args = parse_args()
     base_dir = Path.cwd()
 
+    # Validate the cheap inputs before touching .env, logging sinks or the HTTP client.
+    selected_tasks = parse_selected_tasks(args.tasks)
+    input_path = base_dir / args.input
+    if not input_path.exists():
+        raise FileNotFoundError(f"Input file not found: {input_path}")
+
     continue_on_error = args.continue_on_error.lower() == "true"
     config = load_config(
         continue_on_error=continue_on_error,
@@ -134,11 +254,8 @@ def run() -> int:
     logs_dir, output_dir = ensure_dirs(base_dir, args.outdir)
     log_path = configure_logger(logs_dir)
 
-    selected_tasks = parse_selected_tasks(args.tasks)
-    input_path = base_dir / args.input
-
-    logger.info("Starting translation benchmark")
-    logger.info(
+    _get_logger().info("Starting translation benchmark")
+    _get_logger().info(
         "Config model={}, input={}, outdir={}, tasks={}, workers={}, limits={{'zh_en': {}, 'en_zh': {}}}, seed={}, continue_on_error={}",
         config.model_name,
         input_path,
@@ -151,43 +268,56 @@ def run() -> int:
         config.continue_on_error,
     )
 
-    parsed = parse_exam(input_path)
+    limits = {task: config.zh_en_limit if task == "zh_en" else config.en_zh_limit for task in selected_tasks}
+    stream_sampling = (
+        any(limit != -1 for limit in limits.values())
+        and input_path.is_file()
+        and input_path.stat().st_size >= STREAM_SAMPLING_MIN_BYTES
+    )
+    if stream_sampling:
+        parsed = parse_exam_sampled(input_path, limits=limits, random_seed=config.random_seed)
+    else:
+        parsed = parse_exam(input_path)
     for task in selected_tasks:
-        logger.info("Parsed {} items for {}", len(parsed.tasks[task]), task)
+        _get_logger().info("Parsed {} items for {}", parsed.totals[task], task)
 
     translator = Translator(config)
 
     start = perf_counter()
     total_success = 0
     total_failed = 0
-    combined_rows: list[tuple[ExamItem, str]] = []
-
-    for task in selected_tasks:
-        raw_items = parsed.tasks[task]
-        task_limit = config.zh_en_limit if task == "zh_en" else config.en_zh_limit
-        items = sample_items(task=task, items=raw_items, limit=task_limit, random_seed=config.random_seed)
-        logger.info("Task {} selected {}/{} items", task, len(items), len(raw_items))
-        rows, success_count, fail_count = translate_task(
-            task=task,
-            items=items,
-            translator=translator,
-            continue_on_error=config.continue_on_error,
-            workers=config.workers,
-        )
-        total_success += success_count
-        total_failed += fail_count
-
-        output_path = output_dir / f"result_{task}.csv"
-        write_results_csv(output_path, rows)
-        logger.info("Wrote {} rows to {}", len(rows), output_path)
-        combined_rows.extend(rows)
 
     combine_output_path = output_dir / "result_combine.csv"
-    write_results_csv(combine_output_path, combined_rows)
-    logger.info("Wrote {} rows to {}", len(combined_rows), combine_output_path)
+    with ResultCsvWriter(combine_output_path) as combine_writer:
+        for task in selected_tasks:
+            items = parsed.tasks[task]
+            if not stream_sampling:
+                items = sample_items(task=task, items=items, limit=limits[task], random_seed=config.random_seed)
+            _get_logger().info("Task {} selected {}/{} items", task, len(items), parsed.totals[task])
+
+            output_path = output_dir / f"result_{task}.csv"
+            with ResultCsvWriter(output_path) as task_writer:
+
+                def write_row(item: ExamItem, translation: str) -> None:
+                    task_writer.write_row(item, translation)
+                    combine_writer.write_row(item, translation)
+
+                success_count, fail_count = translate_task(
+                    task=task,
+                    items=items,
+                    translator=translator,
+                    continue_on_error=config.continue_on_error,
+                    workers=config.workers,
+                    on_row=write_row,
+                )
+            total_success += success_count
+            total_failed += fail_count
+            _get_logger().info("Wrote {} rows to {}", task_writer.rows_written, output_path)
+
+    _get_logger().info("Wrote {} rows to {}", combine_writer.rows_written, combine_output_path)
 
     elapsed = perf_counter() - start
-    logger.info(
+    _get_logger().info(
         "Finished. success={}, failed={}, elapsed={:.2f}s, log_file={}",
         total_success,
         total_failed,
@@ -201,7 +331,7 @@ def main() -> None:
     try:
         raise SystemExit(run())
     except Exception as exc:  # noqa: BLE001
-        logger.exception("Run failed: {}", exc)
+        _get_logger().exception("Run failed: {}", exc)
         raise SystemExit(1) from exc
 
 
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import math
+import random
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
+from typing import NamedTuple
 
 VALID_TASKS = {"zh_en", "en_zh"}
+TASK_SEED_OFFSETS = {"zh_en": 11, "en_zh": 29}
 
 
-@dataclass(slots=True)
-class ExamItem:
+class ExamItem(NamedTuple):
     source: str
     line_no: int
 
@@ -15,6 +19,7 @@ class ExamItem:
 @dataclass(slots=True)
 class ParseResult:
     tasks: dict[str, list[ExamItem]]
+    totals: dict[str, int]
 
 
 def parse_exam(path: Path) -> ParseResult:
@@ -22,49 +27,126 @@ def parse_exam(path: Path) -> ParseResult:
         raise FileNotFoundError(f"Input file not found: {path}")
 
     tasks: dict[str, list[ExamItem]] = {"zh_en": [], "en_zh": []}
+    appenders = {task: items.append for task, items in tasks.items()}
+
+    # read_text already normalises newlines; split("\n") rather than splitlines() keeps
+    # line numbers identical to iterating the file.
+    lines = path.read_text(encoding="utf-8").split("\n")
+    for task, line_no, source in _iter_exam_entries(lines):
+        appenders[task](ExamItem(source=source, line_no=line_no))
+
+    return ParseResult(tasks=tasks, totals={task: len(items) for task, items in tasks.items()})
+
+
+def parse_exam_sampled(path: Path, limits: dict[str, int], random_seed: int) -> ParseResult:
+    """Parse the exam file while reservoir-sampling each task in a single pass.
+
+    Each task keeps at most ``limits[task]`` items (Algorithm L), so peak memory is
+    O(limit) instead of O(lines). A limit of -1 keeps every item; tasks missing
+    from ``limits`` are counted but not kept. Sampled items are returned in file order.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Input file not found: {path}")
+
+    reservoirs = {
+        task: _Reservoir(limits.get(task, 0), random.Random(random_seed + TASK_SEED_OFFSETS[task]))
+        for task in TASK_SEED_OFFSETS
+    }
+
+    with path.open("r", encoding="utf-8") as f:
+        for task, line_no, source in _iter_exam_entries(f):
+            reservoirs[task].offer(source, line_no)
+
+    return ParseResult(
+        tasks={task: reservoir.items() for task, reservoir in reservoirs.items()},
+        totals={task: reservoir.count for task, reservoir in reservoirs.items()},
+    )
+
+
+class _Reservoir:
+    """Algorithm L reservoir: after the fill phase, skips ahead geometrically between replacements."""
+
+    __slots__ = ("limit", "rng", "count", "next_index", "log_weight", "_items")
+
+    def __init__(self, limit: int, rng: random.Random) -> None:
+        self.limit = limit
+        self.rng = rng
+        self.count = 0
+        self.next_index = 0
+        self.log_weight = 0.0
+        self._items: list[ExamItem] = []
+
+    def offer(self, source: str, line_no: int) -> None:
+        self.count += 1
+        if self.limit == -1 or self.count <= self.limit:
+            self._items.append(ExamItem(source=source, line_no=line_no))
+            if self.count == self.limit:
+                self.log_weight = math.log(self._random()) / self.limit
+                self._advance()
+            return
+        if self.count == self.next_index:
+            self._items[self.rng.randrange(self.limit)] = ExamItem(source=source, line_no=line_no)
+            self.log_weight += math.log(self._random()) / self.limit
+            self._advance()
+
+    def items(self) -> list[ExamItem]:
+        return sorted(self._items, key=lambda item: item.line_no)
+
+    def _advance(self) -> None:
+        # W is kept as log(W): W itself can round to 1.0 for large limits, where both log(1 - W)
+        # and log1p(-W) fail. log(1 - W) == log(-expm1(log W)) stays finite.
+        log_one_minus_weight = math.log(-math.expm1(self.log_weight))
+        self.next_index = self.count + math.floor(math.log(self._random()) / log_one_minus_weight) + 1
+
+    def _random(self) -> float:
+        # log() needs a value in the open interval (0, 1).
+        value = self.rng.random()
+        while value == 0.0:
+            value = self.rng.random()
+        return value
+
+
+def _iter_exam_entries(lines: Iterable[str]) -> Iterator[tuple[str, int, str]]:
     inside_exam = False
     seen_exam_start = False
     seen_exam_end = False
     current_task: str | None = None
 
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, raw in enumerate(f, start=1):
-            stripped = raw.strip()
+    for line_no, raw in enumerate(lines, start=1):
+        stripped = raw.strip()
 
-            if stripped == "<exam>":
-                inside_exam = True
-                seen_exam_start = True
-                current_task = None
-                continue
+        if stripped == "<exam>":
+            inside_exam = True
+            seen_exam_start = True
+            current_task = None
+            continue
 
-            if stripped == "</exam>":
-                inside_exam = False
-                seen_exam_end = True
-                current_task = None
-                break
+        if stripped == "</exam>":
+            inside_exam = False
+            seen_exam_end = True
+            current_task = None
+            break
 
-            if not inside_exam:
-                continue
+        if not inside_exam:
+            continue
 
-            if stripped in {"<zh_en>", "<en_zh>"}:
-                current_task = stripped[1:-1]
-                continue
+        if stripped in {"<zh_en>", "<en_zh>"}:
+            current_task = stripped[1:-1]
+            continue
 
-            if stripped in {"</zh_en>", "</en_zh>"}:
-                current_task = None
-                continue
+        if stripped in {"</zh_en>", "</en_zh>"}:
+            current_task = None
+            continue
 
-            if current_task is None:
-                continue
+        if current_task is None:
+            continue
 
-            if not stripped or stripped.startswith("#"):
-                continue
+        if not stripped or stripped.startswith("#"):
+            continue
 
-            tasks[current_task].append(ExamItem(source=stripped, line_no=line_no))
+        yield current_task, line_no, stripped
 
     if inside_exam or (seen_exam_start and not seen_exam_end):
         raise ValueError("Malformed exam.txt: missing </exam>")
     if not seen_exam_start:
         raise ValueError("Malformed exam.txt: missing <exam> container")
-
-    return ParseResult(tasks=tasks)
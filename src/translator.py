@@ -1,14 +1,24 @@
 from __future__ import annotations
 
-import time
-import threading
+import asyncio
+import json
+import random
 from dataclasses import dataclass
-
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_openai import ChatOpenAI
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
 from .config import AppConfig
 
+if TYPE_CHECKING:
+    import httpx
+
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
+# Stand-in for the user message while building request templates; NUL-delimited so it never matches real text.
+_SOURCE_PLACEHOLDER = "\x00transbench-source\x00"
+
 SYSTEM_PROMPTS = {
     "zh_en": (
         "You are a professional translator. Translate the user's Chinese text into natural, accurate English. "
@@ -21,6 +31,10 @@ SYSTEM_PROMPTS = {
 }
 
 
+class TranslationResponseError(Exception):
+    """The API answered 2xx but the body is not a usable chat completion."""
+
+
 @dataclass(slots=True)
 class TranslationResult:
     text: str
@@ -30,40 +44,121 @@ class TranslationResult:
 class Translator:
     def __init__(self, config: AppConfig) -> None:
         self.config = config
-        self._local = threading.local()
-
-    def _get_client(self) -> ChatOpenAI:
-        client = getattr(self._local, "client", None)
-        if client is None:
-            client = ChatOpenAI(
-                model=self.config.model_name,
-                api_key=self.config.api_key,
-                base_url=self.config.base_url,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                timeout=self.config.timeout,
-            )
-            self._local.client = client
-        return client
-
-    def translate(self, task: str, source: str) -> TranslationResult:
+        self._client: httpx.AsyncClient | None = None
+        self._request_templates = {task: self._build_request_template(prompt) for task, prompt in SYSTEM_PROMPTS.items()}
+
+    async def __aenter__(self) -> Translator:
+        import httpx
+
+        pool_size = self.config.workers * 2
+        self._client = httpx.AsyncClient(
+            base_url=self.config.base_url or DEFAULT_BASE_URL,
+            headers={"Authorization": f"Bearer {self.config.api_key}", "Content-Type": "application/json"},
+            http2=True,
+            timeout=self.config.timeout,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _build_request_template(self, system_prompt: str) -> tuple[bytes, bytes]:
+        """Serialize the request once and split it around the user content.
+
+        Every request for a task shares the same bytes except the encoded source string,
+        so a body is just prefix + _dumps(source) + suffix.
+        """
+        payload: dict = {
+            "model": self.config.model_name,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": _SOURCE_PLACEHOLDER},
+            ],
+            "temperature": self.config.temperature,
+        }
+        if self.config.max_tokens is not None:
+            payload["max_tokens"] = self.config.max_tokens
+        prefix, suffix = _dumps(payload).split(_dumps(_SOURCE_PLACEHOLDER))
+        return prefix, suffix
+
+    async def _complete(self, body: bytes) -> str:
+        if self._client is None:
+            raise RuntimeError("Translator client is not open; use 'async with translator'")
+        response = await self._client.post("/chat/completions", content=body)
+        response.raise_for_status()
+        data = _loads(response.content)
+        try:
+            content = data["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError) as exc:
+            raise TranslationResponseError(f"Unexpected completion payload: {str(data)[:200]}") from exc
+        # e.g. "content": null on a content-filter stop or reasoning-only output.
+        if not isinstance(content, str):
+            raise TranslationResponseError(f"Completion has no text content: {str(data)[:200]}")
+        return content.strip()
+
+    async def translate(self, task: str, source: str) -> TranslationResult:
         if task not in SYSTEM_PROMPTS:
             return TranslationResult(text="", error=ValueError(f"Unsupported task: {task}"))
 
-        messages = [
-            SystemMessage(content=SYSTEM_PROMPTS[task]),
-            HumanMessage(content=source),
-        ]
+        prefix, suffix = self._request_templates[task]
+        body = b"".join((prefix, _dumps(source), suffix))
 
         last_error: Exception | None = None
         for attempt in range(1, self.config.retries + 1):
             try:
-                response = self._get_client().invoke(messages)
-                translated = str(response.content).strip()
+                translated = await self._complete(body)
                 return TranslationResult(text=translated)
             except Exception as exc:  # noqa: BLE001
                 last_error = exc
+                if not _is_retryable(exc):
+                    break
                 if attempt < self.config.retries:
-                    time.sleep(0.5 * attempt)
+                    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+                    await asyncio.sleep(delay * random.uniform(0.5, 1.5))
 
         return TranslationResult(text="", error=last_error)
+
+
+# orjson is an optional speedup (pip install "transbench[speedups]"), resolved on first use
+# like httpx so importing this module stays free of third-party imports.
+_orjson: ModuleType | None = None
+_orjson_resolved = False
+
+
+def _get_orjson() -> ModuleType | None:
+    global _orjson, _orjson_resolved
+    if not _orjson_resolved:
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+        _orjson = orjson
+        _orjson_resolved = True
+    return _orjson
+
+
+def _dumps(obj: Any) -> bytes:
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _is_retryable(exc: Exception) -> bool:
+    import httpx
+
+    if isinstance(exc, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    return False
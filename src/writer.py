@@ -1,14 +1,62 @@
 from __future__ import annotations
 
-import csv
+import codecs
+import re
 from pathlib import Path
+from typing import IO
 
 from .parser import ExamItem
 
+WRITE_BUFFER_SIZE = 1 << 20
+ROWS_PER_WRITE = 1024
+HEADER = ("原文", "翻译")
+
+# Same rule as csv.QUOTE_MINIMAL for the default dialect.
+_NEEDS_QUOTE = re.compile(r'[",\r\n]')
+
+
+def _quote(field: str) -> str:
+    if _NEEDS_QUOTE.search(field):
+        return '"' + field.replace('"', '""') + '"'
+    return field
+
+
+def _format_row(source: str, translation: str) -> str:
+    return "".join((_quote(source), ",", _quote(translation), "\r\n"))
+
+
+class ResultCsvWriter:
+    """Streams (原文, 翻译) rows into a UTF-8 BOM CSV file as they become available.
+
+    The schema is a fixed two-column table, so rows are formatted by hand rather than
+    through csv.writer, then encoded and written as bytes in blocks of ROWS_PER_WRITE.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.rows_written = 0
+        self._file: IO[bytes] | None = None
+        self._pending: list[str] = []
+
+    def __enter__(self) -> ResultCsvWriter:
+        self._file = self.path.open("wb", buffering=WRITE_BUFFER_SIZE)
+        self._file.write(codecs.BOM_UTF8 + _format_row(*HEADER).encode("utf-8"))
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._file is not None:
+            self._flush()
+            self._file.close()
+            self._file = None
+
+    def write_row(self, item: ExamItem, translation: str) -> None:
+        self._pending.append(_format_row(item.source, translation))
+        self.rows_written += 1
+        if len(self._pending) >= ROWS_PER_WRITE:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._file.write("".join(self._pending).encode("utf-8"))
+            self._pending.clear()
 
-def write_results_csv(path: Path, rows: list[tuple[ExamItem, str]]) -> None:
-    with path.open("w", encoding="utf-8-sig", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["原文", "翻译"])
-        for item, translation in rows:
-            writer.writerow([item.source, translation])